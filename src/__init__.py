@@ -8,9 +8,12 @@ from .utils import (
     detect_outliers_iqr,
     create_distribution_plot,
     calculate_summary_stats,
+    calculate_correlation_matrix,
     create_correlation_heatmap,
     extract_temporal_features,
-    format_large_number
+    format_large_number,
+    upper_triangle_mask,
+    cached_color_palette
 )
 
 __version__ = '1.0.0'
@@ -6,15 +6,21 @@ Run this script to create the visualization figures shown in the README.
 
 import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns
+import multiprocessing
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 
-# Set random seed for reproducibility
-np.random.seed(42)
+from utils import (
+    calculate_correlation_matrix, cached_color_palette, upper_triangle_mask
+)
 
-# Create figures directory if it doesn't exist
-os.makedirs('../figures', exist_ok=True)
+FIGURES_DIR = '../figures'
 
 # Configure plotting style
 plt.style.use('seaborn-v0_8-whitegrid')
@@ -31,249 +37,391 @@ COLORS = {
     'neutral': '#95A5A6'
 }
 
-print("Generating sample visualizations...")
-
 # Generate synthetic data that resembles Udemy courses
 n_samples = 3500
 
 subjects = ['Web Development', 'Business Finance', 'Musical Instruments', 'Graphic Design']
 levels = ['All Levels', 'Beginner Level', 'Intermediate Level', 'Expert Level']
 
-# Create synthetic dataset
-data = {
-    'price': np.concatenate([
-        np.zeros(300),  # Free courses
-        np.random.choice([19.99, 24.99, 29.99, 49.99, 99.99, 149.99, 199.99], n_samples - 300)
-    ]),
-    'num_subscribers': np.random.lognormal(mean=7, sigma=2, size=n_samples).astype(int),
-    'num_reviews': np.random.lognormal(mean=4, sigma=1.5, size=n_samples).astype(int),
-    'num_lectures': np.random.lognormal(mean=3.5, sigma=0.8, size=n_samples).astype(int),
-    'content_duration': np.random.lognormal(mean=2, sigma=0.7, size=n_samples),
-    'subject': np.random.choice(subjects, n_samples, p=[0.4, 0.3, 0.15, 0.15]),
-    'level': np.random.choice(levels, n_samples, p=[0.35, 0.30, 0.25, 0.10]),
-    'year': np.random.choice(range(2012, 2021), n_samples, p=[0.02, 0.03, 0.05, 0.08, 0.12, 0.15, 0.18, 0.20, 0.17])
-}
-
-df = pd.DataFrame(data)
-
-# 1. Correlation Matrix
-print("  Creating correlation matrix...")
-fig, ax = plt.subplots(figsize=(10, 8))
-numeric_cols = ['price', 'num_subscribers', 'num_reviews', 'num_lectures', 'content_duration']
-corr_matrix = df[numeric_cols].corr()
-mask = np.triu(np.ones_like(corr_matrix, dtype=bool))
-
-sns.heatmap(
-    corr_matrix,
-    mask=mask,
-    annot=True,
-    fmt='.2f',
-    cmap='RdBu_r',
-    center=0,
-    square=True,
-    linewidths=0.5,
-    ax=ax,
-    cbar_kws={'shrink': 0.8}
-)
-ax.set_title('Feature Correlation Matrix')
-plt.tight_layout()
-plt.savefig('../figures/correlation_matrix.png', dpi=150, bbox_inches='tight', facecolor='white')
-plt.close()
-
-# 2. Subject Distribution (Pie Chart)
-print("  Creating subject distribution...")
-fig, ax = plt.subplots(figsize=(10, 8))
-subject_counts = df['subject'].value_counts()
-colors = sns.color_palette('Set2', len(subject_counts))
-
-wedges, texts, autotexts = ax.pie(
-    subject_counts.values,
-    labels=subject_counts.index,
-    autopct='%1.1f%%',
-    colors=colors,
-    explode=[0.02] * len(subject_counts),
-    shadow=True,
-    textprops={'fontsize': 11}
-)
-ax.set_title('Course Distribution by Subject Category', fontsize=14, fontweight='bold')
-plt.tight_layout()
-plt.savefig('../figures/subject_distribution.png', dpi=150, bbox_inches='tight', facecolor='white')
-plt.close()
-
-# 3. Subscribers Distribution (Log Scale)
-print("  Creating subscribers distribution...")
-fig, ax = plt.subplots(figsize=(12, 6))
-subscribers_nonzero = df[df['num_subscribers'] > 0]['num_subscribers']
-
-sns.histplot(np.log10(subscribers_nonzero), bins=50, kde=True, 
-             color=COLORS['accent'], alpha=0.7, ax=ax)
-ax.set_title('Distribution of Subscribers (log₁₀ scale)', fontsize=14, fontweight='bold')
-ax.set_xlabel('log₁₀(Number of Subscribers)')
-ax.set_ylabel('Frequency')
-
-for val, label in [(2, '100'), (3, '1K'), (4, '10K'), (5, '100K')]:
-    ax.axvline(val, color=COLORS['neutral'], linestyle=':', alpha=0.5)
-    ax.text(val, ax.get_ylim()[1]*0.95, label, ha='center', fontsize=9)
-
-plt.tight_layout()
-plt.savefig('../figures/subscribers_distribution.png', dpi=150, bbox_inches='tight', facecolor='white')
-plt.close()
-
-# 4. Price vs Subscribers
-print("  Creating price vs subscribers plot...")
-fig, ax = plt.subplots(figsize=(12, 6))
-paid_df = df[(df['price'] > 0) & (df['num_subscribers'] > 0)]
-
-scatter = ax.scatter(
-    paid_df['price'],
-    paid_df['num_subscribers'],
-    alpha=0.4,
-    c=COLORS['primary'],
-    s=20
-)
-
-ax.set_xlabel('Price ($)')
-ax.set_ylabel('Number of Subscribers')
-ax.set_title('Price vs Subscribers for Paid Courses', fontsize=14, fontweight='bold')
-ax.set_yscale('log')
-
-plt.tight_layout()
-plt.savefig('../figures/price_vs_subscribers.png', dpi=150, bbox_inches='tight', facecolor='white')
-plt.close()
-
-# 5. Yearly Trend
-print("  Creating yearly trend...")
-fig, ax = plt.subplots(figsize=(14, 6))
-yearly_counts = df.groupby('year').size()
-
-bars = ax.bar(yearly_counts.index, yearly_counts.values, color=COLORS['primary'], alpha=0.8)
-ax.plot(yearly_counts.index, yearly_counts.values, 'o-', color=COLORS['secondary'], linewidth=2, markersize=8)
-
-ax.set_xlabel('Year')
-ax.set_ylabel('Number of Courses Published')
-ax.set_title('Course Publications Over Time', fontsize=14, fontweight='bold')
-
-# Add growth annotations
-for i in range(1, len(yearly_counts)):
-    growth = (yearly_counts.iloc[i] - yearly_counts.iloc[i-1]) / yearly_counts.iloc[i-1] * 100
-    if abs(growth) > 10:
-        ax.annotate(f'{growth:+.0f}%', 
-                   xy=(yearly_counts.index[i], yearly_counts.iloc[i]),
+price_choices = np.array([19.99, 24.99, 29.99, 49.99, 99.99, 149.99, 199.99])
+subject_choices = np.array(subjects)
+level_choices = np.array(levels)
+year_choices = np.arange(2012, 2021)
+
+# The generated dataset is cached; delete this file after changing the generator
+df_path = Path(FIGURES_DIR) / '_synth.parquet'
+
+
+def load_synthetic_data() -> pd.DataFrame:
+    """Load the cached synthetic dataset, generating it on first run."""
+    if df_path.exists():
+        return pd.read_parquet(df_path)
+
+    df = _generate_synthetic_data()
+
+    try:
+        df.to_parquet(df_path)
+    except ImportError:
+        # pyarrow is optional; regenerate on every run without it
+        pass
+
+    return df
+
+
+def _generate_synthetic_data() -> pd.DataFrame:
+    # Seeded generator for reproducibility
+    rng = np.random.default_rng(42)
+
+    # Create synthetic dataset
+    data = {
+        'price': np.concatenate([
+            np.zeros(300),  # Free courses
+            rng.choice(price_choices, n_samples - 300)
+        ]),
+        'num_subscribers': rng.lognormal(mean=7, sigma=2, size=n_samples).astype(int),
+        'num_reviews': rng.lognormal(mean=4, sigma=1.5, size=n_samples).astype(int),
+        'num_lectures': rng.lognormal(mean=3.5, sigma=0.8, size=n_samples).astype(int),
+        'content_duration': rng.lognormal(mean=2, sigma=0.7, size=n_samples),
+        'subject': rng.choice(subject_choices, n_samples, p=[0.4, 0.3, 0.15, 0.15]),
+        'level': rng.choice(level_choices, n_samples, p=[0.35, 0.30, 0.25, 0.10]),
+        'year': rng.choice(year_choices, n_samples, p=[0.02, 0.03, 0.05, 0.08, 0.12, 0.15, 0.18, 0.20, 0.17])
+    }
+
+    df = pd.DataFrame(data)
+
+    # Low-cardinality labels as categoricals; the dtype survives the parquet cache
+    df['subject'] = df['subject'].astype('category')
+    df['level'] = df['level'].astype('category')
+
+    return df
+
+
+def _reset_figure(fig: plt.Figure, width: float, height: float) -> None:
+    """Clear the reused figure and resize it for the next plot."""
+    fig.clf()
+    fig.set_size_inches(width, height)
+
+
+def _save_figure(fig: plt.Figure, filename: str, dpi: int = 150) -> None:
+    fig.tight_layout()
+    fig.savefig(os.path.join(FIGURES_DIR, filename), dpi=dpi,
+                bbox_inches='tight', facecolor='white')
+
+
+def plot_correlation_matrix(df: pd.DataFrame, fig: plt.Figure) -> None:
+    """1. Correlation Matrix"""
+    print("  Creating correlation matrix...")
+    _reset_figure(fig, 10, 8)
+    ax = fig.add_subplot(111)
+    numeric_cols = ['price', 'num_subscribers', 'num_reviews', 'num_lectures', 'content_duration']
+    corr_matrix = calculate_correlation_matrix(df, numeric_cols)
+    mask = upper_triangle_mask(len(numeric_cols))
+
+    sns.heatmap(
+        corr_matrix,
+        mask=mask,
+        annot=True,
+        fmt='.2f',
+        cmap='RdBu_r',
+        center=0,
+        square=True,
+        linewidths=0.5,
+        ax=ax,
+        cbar_kws={'shrink': 0.8}
+    )
+    ax.set_title('Feature Correlation Matrix')
+    _save_figure(fig, 'correlation_matrix.png')
+
+
+def plot_subject_distribution(df: pd.DataFrame, fig: plt.Figure) -> None:
+    """2. Subject Distribution (Pie Chart)"""
+    print("  Creating subject distribution...")
+    _reset_figure(fig, 10, 8)
+    ax = fig.add_subplot(111)
+    subject_counts = df['subject'].value_counts()
+    colors = cached_color_palette('Set2', len(subject_counts))
+
+    wedges, texts, autotexts = ax.pie(
+        subject_counts.values,
+        labels=subject_counts.index,
+        autopct='%1.1f%%',
+        colors=colors,
+        explode=[0.02] * len(subject_counts),
+        shadow=True,
+        textprops={'fontsize': 11}
+    )
+    ax.set_title('Course Distribution by Subject Category', fontsize=14, fontweight='bold')
+    _save_figure(fig, 'subject_distribution.png')
+
+
+def plot_subscribers_distribution(df: pd.DataFrame, fig: plt.Figure) -> None:
+    """3. Subscribers Distribution (Log Scale)"""
+    print("  Creating subscribers distribution...")
+    _reset_figure(fig, 12, 6)
+    ax = fig.add_subplot(111)
+    subscribers = df['num_subscribers'].to_numpy()
+    nonzero = subscribers > 0
+    log_subscribers = np.log10(subscribers, where=nonzero,
+                               out=np.empty_like(subscribers, dtype=np.float64))
+
+    sns.histplot(log_subscribers[nonzero], bins=50, kde=True,
+                 color=COLORS['accent'], alpha=0.7, ax=ax)
+    ax.set_title('Distribution of Subscribers (log₁₀ scale)', fontsize=14, fontweight='bold')
+    ax.set_xlabel('log₁₀(Number of Subscribers)')
+    ax.set_ylabel('Frequency')
+
+    for val, label in [(2, '100'), (3, '1K'), (4, '10K'), (5, '100K')]:
+        ax.axvline(val, color=COLORS['neutral'], linestyle=':', alpha=0.5)
+        ax.text(val, ax.get_ylim()[1]*0.95, label, ha='center', fontsize=9)
+
+    _save_figure(fig, 'subscribers_distribution.png')
+
+
+def plot_price_vs_subscribers(df: pd.DataFrame, fig: plt.Figure) -> None:
+    """4. Price vs Subscribers"""
+    print("  Creating price vs subscribers plot...")
+    _reset_figure(fig, 12, 6)
+    ax = fig.add_subplot(111)
+    price = df['price'].to_numpy()
+    subscribers = df['num_subscribers'].to_numpy()
+    paid = (price > 0) & (subscribers > 0)
+
+    scatter = ax.scatter(
+        price[paid],
+        subscribers[paid],
+        alpha=0.4,
+        c=COLORS['primary'],
+        s=20,
+        rasterized=True
+    )
+
+    ax.set_xlabel('Price ($)')
+    ax.set_ylabel('Number of Subscribers')
+    ax.set_title('Price vs Subscribers for Paid Courses', fontsize=14, fontweight='bold')
+    ax.set_yscale('log')
+
+    _save_figure(fig, 'price_vs_subscribers.png', dpi=100)
+
+
+def plot_yearly_trend(df: pd.DataFrame, fig: plt.Figure) -> None:
+    """5. Yearly Trend"""
+    print("  Creating yearly trend...")
+    _reset_figure(fig, 14, 6)
+    ax = fig.add_subplot(111)
+    yearly_counts = df.groupby('year').size()
+
+    bars = ax.bar(yearly_counts.index, yearly_counts.values, color=COLORS['primary'], alpha=0.8)
+    ax.plot(yearly_counts.index, yearly_counts.values, 'o-', color=COLORS['secondary'], linewidth=2, markersize=8)
+
+    ax.set_xlabel('Year')
+    ax.set_ylabel('Number of Courses Published')
+    ax.set_title('Course Publications Over Time', fontsize=14, fontweight='bold')
+
+    # Add growth annotations
+    counts = yearly_counts.to_numpy(dtype=np.float64)
+    growth = np.concatenate(([0.0], np.diff(counts) / counts[:-1] * 100))
+    for i in np.flatnonzero(np.abs(growth) > 10):
+        ax.annotate(f'{growth[i]:+.0f}%',
+                   xy=(yearly_counts.index[i], counts[i]),
                    xytext=(0, 10), textcoords='offset points',
                    ha='center', fontsize=9, color=COLORS['secondary'], fontweight='bold')
 
-plt.tight_layout()
-plt.savefig('../figures/yearly_trend.png', dpi=150, bbox_inches='tight', facecolor='white')
-plt.close()
-
-# 6. Free vs Paid Distribution
-print("  Creating free vs paid distribution...")
-fig, axes = plt.subplots(1, 2, figsize=(14, 5))
-
-df['is_paid'] = df['price'].apply(lambda x: 'Paid' if x > 0 else 'Free')
-
-sns.boxplot(data=df, x='is_paid', y='num_subscribers', ax=axes[0], palette='Set2')
-axes[0].set_yscale('log')
-axes[0].set_title('Subscriber Distribution: Free vs Paid', fontsize=12, fontweight='bold')
-axes[0].set_xlabel('')
-axes[0].set_ylabel('Subscribers (log scale)')
-
-pricing_counts = df['is_paid'].value_counts()
-axes[1].pie(pricing_counts.values, labels=pricing_counts.index, autopct='%1.1f%%',
-            colors=[COLORS['accent'], COLORS['secondary']], explode=[0.02, 0.02], shadow=True)
-axes[1].set_title('Course Distribution: Free vs Paid', fontsize=12, fontweight='bold')
-
-plt.tight_layout()
-plt.savefig('../figures/free_vs_paid.png', dpi=150, bbox_inches='tight', facecolor='white')
-plt.close()
-
-# 7. Subject Trends Over Time
-print("  Creating subject trends...")
-fig, ax = plt.subplots(figsize=(14, 6))
-subject_yearly = df.groupby(['year', 'subject']).size().unstack(fill_value=0)
-
-subject_yearly.plot(kind='area', stacked=True, alpha=0.8, ax=ax)
-ax.set_xlabel('Year')
-ax.set_ylabel('Number of Courses')
-ax.set_title('Subject Category Trends Over Time', fontsize=14, fontweight='bold')
-ax.legend(title='Subject', bbox_to_anchor=(1.02, 1), loc='upper left')
-
-plt.tight_layout()
-plt.savefig('../figures/subject_trends.png', dpi=150, bbox_inches='tight', facecolor='white')
-plt.close()
-
-# 8. Level Distribution
-print("  Creating level distribution...")
-fig, ax = plt.subplots(figsize=(10, 6))
-level_counts = df['level'].value_counts()
-colors = sns.color_palette('husl', len(level_counts))
-
-bars = ax.barh(level_counts.index, level_counts.values, color=colors)
-ax.set_xlabel('Number of Courses')
-ax.set_title('Course Distribution by Difficulty Level', fontsize=14, fontweight='bold')
-
-for bar, val in zip(bars, level_counts.values):
-    ax.text(val + 20, bar.get_y() + bar.get_height()/2, 
-            f'{val:,}', va='center', fontsize=10)
-
-ax.set_xlim(0, level_counts.max() * 1.15)
-plt.tight_layout()
-plt.savefig('../figures/level_distribution.png', dpi=150, bbox_inches='tight', facecolor='white')
-plt.close()
-
-# 9. Price Distribution
-print("  Creating price distribution...")
-fig, axes = plt.subplots(1, 2, figsize=(14, 5))
-
-paid_prices = df[df['price'] > 0]['price']
-sns.histplot(paid_prices, bins=30, kde=True, ax=axes[0], color=COLORS['primary'], alpha=0.7)
-axes[0].set_title('Distribution of Course Prices')
-axes[0].set_xlabel('Price ($)')
-axes[0].axvline(paid_prices.mean(), color=COLORS['secondary'], linestyle='--', 
-                label=f'Mean: ${paid_prices.mean():.2f}')
-axes[0].axvline(paid_prices.median(), color=COLORS['accent'], linestyle='-', 
-                label=f'Median: ${paid_prices.median():.2f}')
-axes[0].legend()
-
-sns.boxplot(x=paid_prices, ax=axes[1], color=COLORS['primary'])
-axes[1].set_title('Box Plot of Course Prices')
-axes[1].set_xlabel('Price ($)')
-
-plt.tight_layout()
-plt.savefig('../figures/price_distribution.png', dpi=150, bbox_inches='tight', facecolor='white')
-plt.close()
-
-# 10. Create a banner image
-print("  Creating banner...")
-fig, ax = plt.subplots(figsize=(16, 4))
-
-# Background gradient effect
-x = np.linspace(0, 10, 100)
-y = np.linspace(0, 4, 50)
-X, Y = np.meshgrid(x, y)
-Z = np.sin(X * 0.5) * np.cos(Y * 0.5) * 0.5
-
-ax.contourf(X, Y, Z, levels=20, cmap='Blues', alpha=0.3)
-
-# Add decorative circles
-for cx, cy, r, c in [(1.5, 2, 0.6, COLORS['primary']), (8.5, 2, 0.6, COLORS['accent']),
-                      (2.5, 3.2, 0.3, COLORS['secondary']), (7.5, 0.8, 0.3, COLORS['secondary'])]:
-    circle = plt.Circle((cx, cy), r, color=c, alpha=0.3)
-    ax.add_patch(circle)
-
-# Add title text
-ax.text(5, 2.2, 'Udemy Courses', fontsize=42, ha='center', va='center', 
-        fontweight='bold', color='#2C3E50')
-ax.text(5, 1.2, 'Exploratory Data Analysis', fontsize=24, ha='center', va='center',
-        color='#5A4FCF', fontstyle='italic')
-
-ax.set_xlim(0, 10)
-ax.set_ylim(0, 4)
-ax.axis('off')
-
-plt.tight_layout()
-plt.savefig('../figures/banner.png', dpi=150, bbox_inches='tight', facecolor='white')
-plt.close()
-
-print("\n✓ All visualizations generated successfully!")
-print(f"  Figures saved to: ../figures/")
+    _save_figure(fig, 'yearly_trend.png')
+
+
+def plot_free_vs_paid(df: pd.DataFrame, fig: plt.Figure) -> None:
+    """6. Free vs Paid Distribution"""
+    print("  Creating free vs paid distribution...")
+    _reset_figure(fig, 14, 5)
+    axes = fig.subplots(1, 2)
+
+    # Kept out of df so the frame shared by all plots is not modified
+    is_paid = df['price'].to_numpy() > 0
+    pricing = pd.Series(
+        pd.Categorical.from_codes(is_paid.astype(np.int8), categories=['Free', 'Paid']),
+        index=df.index
+    )
+
+    sns.boxplot(x=pricing, y=df['num_subscribers'], ax=axes[0], palette='Set2')
+    axes[0].set_yscale('log')
+    axes[0].set_title('Subscriber Distribution: Free vs Paid', fontsize=12, fontweight='bold')
+    axes[0].set_xlabel('')
+    axes[0].set_ylabel('Subscribers (log scale)')
+
+    pricing_counts = pricing.value_counts()
+    axes[1].pie(pricing_counts.values, labels=pricing_counts.index, autopct='%1.1f%%',
+                colors=[COLORS['accent'], COLORS['secondary']], explode=[0.02, 0.02], shadow=True)
+    axes[1].set_title('Course Distribution: Free vs Paid', fontsize=12, fontweight='bold')
+
+    _save_figure(fig, 'free_vs_paid.png')
+
+
+def plot_subject_trends(df: pd.DataFrame, fig: plt.Figure) -> None:
+    """7. Subject Trends Over Time"""
+    print("  Creating subject trends...")
+    _reset_figure(fig, 14, 6)
+    ax = fig.add_subplot(111)
+    years = np.arange(df['year'].min(), df['year'].max() + 1)
+    year_codes = df['year'].to_numpy() - years[0]
+
+    # Codes from the column's own (sorted) categories, so any subject counts;
+    # rows without a subject (code -1) are dropped, as groupby does
+    subject = df['subject'].astype('category').cat
+    subject_order = list(subject.categories)
+    subject_codes = subject.codes.to_numpy()
+    valid = subject_codes >= 0
+
+    # Year x subject counts from one flat bincount over the combined codes
+    counts = np.bincount(year_codes[valid] * len(subject_order) + subject_codes[valid],
+                         minlength=len(years) * len(subject_order))
+    subject_yearly = pd.DataFrame(counts.reshape(len(years), len(subject_order)),
+                                  index=years, columns=subject_order)
+
+    subject_yearly.plot(kind='area', stacked=True, alpha=0.8, ax=ax)
+    ax.set_xlabel('Year')
+    ax.set_ylabel('Number of Courses')
+    ax.set_title('Subject Category Trends Over Time', fontsize=14, fontweight='bold')
+    ax.legend(title='Subject', bbox_to_anchor=(1.02, 1), loc='upper left')
+
+    _save_figure(fig, 'subject_trends.png')
+
+
+def plot_level_distribution(df: pd.DataFrame, fig: plt.Figure) -> None:
+    """8. Level Distribution"""
+    print("  Creating level distribution...")
+    _reset_figure(fig, 10, 6)
+    ax = fig.add_subplot(111)
+    level_counts = df['level'].value_counts()
+    colors = cached_color_palette('husl', len(level_counts))
+
+    bars = ax.barh(level_counts.index, level_counts.values, color=colors)
+    ax.set_xlabel('Number of Courses')
+    ax.set_title('Course Distribution by Difficulty Level', fontsize=14, fontweight='bold')
+
+    for bar, val in zip(bars, level_counts.values):
+        ax.text(val + 20, bar.get_y() + bar.get_height()/2,
+                f'{val:,}', va='center', fontsize=10)
+
+    ax.set_xlim(0, level_counts.max() * 1.15)
+    _save_figure(fig, 'level_distribution.png')
+
+
+def plot_price_distribution(df: pd.DataFrame, fig: plt.Figure) -> None:
+    """9. Price Distribution"""
+    print("  Creating price distribution...")
+    _reset_figure(fig, 14, 5)
+    axes = fig.subplots(1, 2)
+
+    price = df['price'].to_numpy()
+    paid_prices = price[price > 0]
+    sns.histplot(paid_prices, bins=30, kde=True, ax=axes[0], color=COLORS['primary'], alpha=0.7)
+    axes[0].set_title('Distribution of Course Prices')
+    axes[0].set_xlabel('Price ($)')
+    axes[0].axvline(paid_prices.mean(), color=COLORS['secondary'], linestyle='--',
+                    label=f'Mean: ${paid_prices.mean():.2f}')
+    axes[0].axvline(np.median(paid_prices), color=COLORS['accent'], linestyle='-',
+                    label=f'Median: ${np.median(paid_prices):.2f}')
+    axes[0].legend()
+
+    sns.boxplot(x=paid_prices, ax=axes[1], color=COLORS['primary'])
+    axes[1].set_title('Box Plot of Course Prices')
+    axes[1].set_xlabel('Price ($)')
+
+    _save_figure(fig, 'price_distribution.png')
+
+
+def plot_banner(df: pd.DataFrame, fig: plt.Figure) -> None:
+    """10. Create a banner image"""
+    print("  Creating banner...")
+    _reset_figure(fig, 16, 4)
+    ax = fig.add_subplot(111)
+
+    # Background gradient effect
+    x = np.linspace(0, 10, 100)
+    y = np.linspace(0, 4, 50)
+    # Separable surface: outer product of the 1D factors, no meshgrid needed
+    Z = 0.5 * np.outer(np.cos(y * 0.5), np.sin(x * 0.5))
+
+    ax.contourf(x, y, Z, levels=20, cmap='Blues', alpha=0.3)
+
+    # Add decorative circles
+    for cx, cy, r, c in [(1.5, 2, 0.6, COLORS['primary']), (8.5, 2, 0.6, COLORS['accent']),
+                          (2.5, 3.2, 0.3, COLORS['secondary']), (7.5, 0.8, 0.3, COLORS['secondary'])]:
+        circle = plt.Circle((cx, cy), r, color=c, alpha=0.3)
+        ax.add_patch(circle)
+
+    # Add title text
+    ax.text(5, 2.2, 'Udemy Courses', fontsize=42, ha='center', va='center',
+            fontweight='bold', color='#2C3E50')
+    ax.text(5, 1.2, 'Exploratory Data Analysis', fontsize=24, ha='center', va='center',
+            color='#5A4FCF', fontstyle='italic')
+
+    ax.set_xlim(0, 10)
+    ax.set_ylim(0, 4)
+    ax.axis('off')
+
+    _save_figure(fig, 'banner.png')
+
+
+PLOTS = [
+    plot_correlation_matrix,
+    plot_subject_distribution,
+    plot_subscribers_distribution,
+    plot_price_vs_subscribers,
+    plot_yearly_trend,
+    plot_free_vs_paid,
+    plot_subject_trends,
+    plot_level_distribution,
+    plot_price_distribution,
+    plot_banner
+]
+
+# Per-worker state: the dataset and a single figure reused across its plots
+_worker_df = None
+_worker_fig = None
+
+
+def _init_worker(df: pd.DataFrame) -> None:
+    global _worker_df, _worker_fig
+    _worker_df = df
+    _worker_fig = plt.figure()
+
+
+def _run_plot(plot) -> None:
+    plot(_worker_df, _worker_fig)
+
+
+def main() -> None:
+    # Create figures directory if it doesn't exist
+    os.makedirs(FIGURES_DIR, exist_ok=True)
+
+    print("Generating sample visualizations...")
+    df = load_synthetic_data()
+
+    max_workers = min(len(PLOTS), os.cpu_count() or 1)
+
+    if max_workers == 1:
+        # A pool would only add worker start-up cost on a single core
+        _init_worker(df)
+        for plot in PLOTS:
+            _run_plot(plot)
+        plt.close(_worker_fig)
+    else:
+        # The figures are independent, so render them in parallel. On Linux,
+        # forked workers inherit the dataframe instead of unpickling it;
+        # elsewhere (fork is unsafe on macOS) keep the platform default.
+        if sys.platform.startswith('linux'):
+            context = multiprocessing.get_context('fork')
+        else:
+            context = None
+
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context,
+                                 initializer=_init_worker, initargs=(df,)) as executor:
+            list(executor.map(_run_plot, PLOTS))
+
+    print("\n✓ All visualizations generated successfully!")
+    print(f"  Figures saved to: {FIGURES_DIR}/")
+
+
+if __name__ == '__main__':
+    main()
@@ -5,6 +5,14 @@ This module contains helper functions for data processing,
 visualization, and statistical analysis.
 """
 
+import contextlib
+import functools
+import importlib.util
+import os
+import tempfile
+import warnings
+from pathlib import Path
+
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -12,25 +20,277 @@ import seaborn as sns
 from typing import Union, List, Dict, Optional, Tuple
 
 
-def load_data(filepath: str) -> pd.DataFrame:
+# Timestamp layout used by the Udemy dataset (e.g. '2017-01-18T20:58:58Z')
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%S%z'
+
+
+@functools.lru_cache(maxsize=16)
+def upper_triangle_mask(n: int) -> np.ndarray:
+    """
+    Upper-triangle mask for an n x n correlation heatmap.
+    
+    The mask is cached per size and returned read-only, since every caller
+    shares the same array.
+    
+    Parameters
+    ----------
+    n : int
+        Number of rows and columns of the correlation matrix.
+        
+    Returns
+    -------
+    np.ndarray
+        Boolean (n, n) array, True on and above the diagonal.
+    """
+    mask = np.triu(np.ones((n, n), dtype=bool))
+    mask.setflags(write=False)
+    return mask
+
+
+@functools.lru_cache(maxsize=32)
+def cached_color_palette(name: str, n_colors: int) -> Tuple[Tuple[float, float, float], ...]:
+    """
+    Cached ``sns.color_palette`` lookup.
+    
+    Parameters
+    ----------
+    name : str
+        Seaborn palette name.
+    n_colors : int
+        Number of colors.
+        
+    Returns
+    -------
+    tuple
+        RGB tuples, immutable so the cached value cannot be modified.
+    """
+    return tuple(sns.color_palette(name, n_colors))
+
+
+# Arrays at least this long are counted with the Numba kernel
+_NUMBA_MIN_SIZE = 1_000_000
+
+# numba is optional; NumPy fallbacks are used without it
+_HAS_NUMBA = importlib.util.find_spec('numba') is not None
+
+
+def _count_outside(arr, lower, upper):
+    """Count values strictly outside [lower, upper] in one pass."""
+    count = 0
+    for i in range(arr.shape[0]):
+        if arr[i] < lower or arr[i] > upper:
+            count += 1
+    return count
+
+
+def _column_moments(values):
+    """
+    Per-column streaming moments of a (ncols, nrows) array.
+    
+    Returns a (ncols, 8) array of count, mean, M2, M3, M4, min, max and
+    missing, where M2-M4 are central moment sums (Welford/Terriberry).
+    """
+    ncols, nrows = values.shape
+    out = np.empty((ncols, 8))
+    for j in range(ncols):
+        count = 0.0
+        mean = 0.0
+        M2 = 0.0
+        M3 = 0.0
+        M4 = 0.0
+        lo = np.inf
+        hi = -np.inf
+        missing = 0.0
+        for i in range(nrows):
+            x = values[j, i]
+            if np.isnan(x):
+                missing += 1.0
+                continue
+            n1 = count
+            count += 1.0
+            delta = x - mean
+            delta_n = delta / count
+            delta_n2 = delta_n * delta_n
+            term1 = delta * delta_n * n1
+            mean += delta_n
+            M4 += (term1 * delta_n2 * (count * count - 3.0 * count + 3.0)
+                   + 6.0 * delta_n2 * M2 - 4.0 * delta_n * M3)
+            M3 += term1 * delta_n * (count - 2.0) - 3.0 * delta_n * M2
+            M2 += term1
+            lo = min(lo, x)
+            hi = max(hi, x)
+        if count == 0.0:
+            mean = np.nan
+            lo = np.nan
+            hi = np.nan
+        out[j, 0] = count
+        out[j, 1] = mean
+        out[j, 2] = M2
+        out[j, 3] = M3
+        out[j, 4] = M4
+        out[j, 5] = lo
+        out[j, 6] = hi
+        out[j, 7] = missing
+    return out
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_kernels():
+    """
+    Compile the kernels above on first use, or load them from the disk cache.
+    
+    numba is only imported here, so importing this module stays cheap for
+    callers that never reach a kernel. The kernels are deliberately serial:
+    parallel=True would start Numba's thread pool, and processes forked
+    after that hang on exit.
+    """
+    from numba import njit, types
+    
+    def compile_cached(signatures, func):
+        try:
+            return njit(signatures, cache=True)(func)
+        except ImportError:
+            # The cache was written while this module was imported under its
+            # other name (``utils`` vs ``src.utils``); compile without it
+            return njit(signatures)(func)
+    
+    count_outside = compile_cached('int64(float64[::1], float64, float64)', _count_outside)
+    # pandas hands out read-only views, so accept those as well
+    column_moments = compile_cached([
+        'float64[:, ::1](float64[:, ::1])',
+        types.float64[:, ::1](types.Array(types.float64, 2, 'C', readonly=True))
+    ], _column_moments)
+    
+    return count_outside, column_moments
+
+
+def _column_moments_numpy(values: np.ndarray) -> np.ndarray:
+    """NumPy fallback for ``_column_moments`` when numba is unavailable."""
+    nan_mask = np.isnan(values)
+    missing = nan_mask.sum(axis=1).astype(np.float64)
+    count = values.shape[1] - missing
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.nansum(values, axis=1) / count
+        centered = np.where(nan_mask, 0.0, values - mean[:, None])
+    centered2 = centered * centered
+    
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        lo = np.nanmin(values, axis=1) if values.shape[1] else np.full(len(values), np.nan)
+        hi = np.nanmax(values, axis=1) if values.shape[1] else np.full(len(values), np.nan)
+    
+    return np.column_stack([
+        count,
+        mean,
+        centered2.sum(axis=1),
+        (centered2 * centered).sum(axis=1),
+        (centered2 * centered2).sum(axis=1),
+        lo,
+        hi,
+        missing
+    ])
+
+
+def _write_parquet_cache(df: pd.DataFrame, cache_path: Path) -> None:
+    """
+    Write ``df`` to ``cache_path`` atomically, skipping the cache on failure.
+    
+    The frame goes to a temporary file in the same directory and is then
+    moved into place, so an interrupted write never leaves a truncated cache
+    that looks newer than the CSV.
+    """
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=cache_path.parent, prefix=cache_path.name, suffix='.tmp'
+        )
+        os.close(fd)
+        df.to_parquet(tmp_path, engine='pyarrow', compression='zstd')
+        os.replace(tmp_path, cache_path)
+        tmp_path = None
+    except Exception:
+        # Missing pyarrow, a read-only directory, a full disk or a column
+        # pyarrow cannot convert (e.g. mixed types): just don't cache
+        pass
+    finally:
+        if tmp_path is not None:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+
+
+def load_data(
+    filepath: str,
+    use_cache: bool = True,
+    dtype: str = 'downcast',
+    categorical_cols: Tuple[str, ...] = ('subject', 'level')
+) -> pd.DataFrame:
     """
     Load and perform initial preprocessing on the dataset.
     
+    The preprocessed dataframe is cached as a Parquet file next to the CSV
+    (e.g. ``udemy_courses.parquet``), so repeated loads skip CSV parsing.
+    The cache is rebuilt whenever the CSV is newer than it.
+    
     Parameters
     ----------
     filepath : str
-        Path to the CSV file.
+        Path to the CSV file, or anything else ``pd.read_csv`` accepts.
+    use_cache : bool, optional
+        Read from and write to the Parquet cache. Only local file paths are
+        cached; URLs and file objects are always parsed. Default is True.
+    dtype : {'downcast', 'full'}, optional
+        'downcast' stores integer columns as int32 (when their values fit)
+        and float columns as float32, halving their memory footprint.
+        'full' keeps the 64-bit types. Default is 'downcast'.
+    categorical_cols : tuple of str, optional
+        Low-cardinality text columns to store as ``category`` dtype, so
+        grouping and counting work on integer codes. Columns not present
+        are ignored. Default is ('subject', 'level').
         
     Returns
     -------
     pd.DataFrame
         Loaded and preprocessed dataframe.
     """
-    df = pd.read_csv(filepath)
+    if dtype not in ('downcast', 'full'):
+        raise ValueError(f"dtype must be 'downcast' or 'full', got {dtype!r}")
+    
+    cache_path = None
+    if (use_cache and isinstance(filepath, (str, os.PathLike))
+            and '://' not in str(filepath)):
+        csv_path = Path(filepath)
+        cache_path = csv_path.with_suffix('.parquet')
+    
+    if (cache_path is not None and cache_path.exists()
+            and cache_path.stat().st_mtime >= csv_path.stat().st_mtime):
+        df = pd.read_parquet(cache_path, engine='pyarrow')
+    else:
+        df = pd.read_csv(filepath)
+        
+        # Convert timestamp
+        if 'published_timestamp' in df.columns:
+            try:
+                df['published_timestamp'] = pd.to_datetime(
+                    df['published_timestamp'], format=TIMESTAMP_FORMAT
+                )
+            except ValueError:
+                df['published_timestamp'] = pd.to_datetime(df['published_timestamp'])
+        
+        if cache_path is not None:
+            _write_parquet_cache(df, cache_path)
+    
+    if dtype == 'downcast':
+        int32 = np.iinfo(np.int32)
+        for col in df.select_dtypes('int64').columns:
+            if df[col].min() >= int32.min and df[col].max() <= int32.max:
+                df[col] = df[col].astype(np.int32)
+        for col in df.select_dtypes('float64').columns:
+            df[col] = df[col].astype(np.float32)
     
-    # Convert timestamp
-    if 'published_timestamp' in df.columns:
-        df['published_timestamp'] = pd.to_datetime(df['published_timestamp'])
+    for col in categorical_cols:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
     
     return df
 
@@ -49,18 +309,21 @@ def analyze_missing_values(df: pd.DataFrame) -> Union[pd.DataFrame, str]:
     Union[pd.DataFrame, str]
         DataFrame with missing value statistics or message if no missing values.
     """
-    missing = df.isnull().sum()
-    missing_pct = (missing / len(df)) * 100
+    # Count per column instead of materializing an n x k boolean frame
+    counts = {
+        col: int(np.count_nonzero(pd.isna(df[col].to_numpy())))
+        for col in df.columns
+    }
+    missing = pd.Series(
+        {col: count for col, count in counts.items() if count > 0},
+        dtype=np.int64
+    )
     
     report = pd.DataFrame({
         'Missing Count': missing,
-        'Missing %': missing_pct,
-        'Data Type': df.dtypes
-    })
-    
-    report = report[report['Missing Count'] > 0].sort_values(
-        'Missing %', ascending=False
-    )
+        'Missing %': (missing / len(df)) * 100,
+        'Data Type': df.dtypes[missing.index]
+    }).sort_values('Missing %', ascending=False)
     
     return report if len(report) > 0 else "No missing values detected."
 
@@ -84,18 +347,39 @@ def detect_outliers_iqr(
     dict
         Dictionary containing outlier count, percentage, and bounds.
     """
-    Q1 = series.quantile(0.25)
-    Q3 = series.quantile(0.75)
+    arr = np.asarray(series, dtype=np.float64)
+    arr = arr[~np.isnan(arr)]
+    n = arr.size
+    
+    if n == 0:
+        return {
+            'count': 0,
+            'percentage': 0.0,
+            'lower_bound': np.nan,
+            'upper_bound': np.nan
+        }
+    
+    # Both quartiles (linear interpolation, as in Series.quantile) from a
+    # single in-place O(n) partition instead of two full sorts
+    positions = np.array([0.25, 0.75]) * (n - 1)
+    lo = np.floor(positions).astype(np.intp)
+    hi = np.minimum(lo + 1, n - 1)
+    arr.partition(np.unique(np.concatenate([lo, hi])))
+    Q1, Q3 = arr[lo] + (arr[hi] - arr[lo]) * (positions - lo)
     IQR = Q3 - Q1
     
     lower_bound = Q1 - multiplier * IQR
     upper_bound = Q3 + multiplier * IQR
     
-    outliers = (series < lower_bound) | (series > upper_bound)
+    if _HAS_NUMBA and n >= _NUMBA_MIN_SIZE:
+        count_outside, _ = _numba_kernels()
+        count = int(count_outside(arr, lower_bound, upper_bound))
+    else:
+        count = int(np.count_nonzero((arr < lower_bound) | (arr > upper_bound)))
     
     return {
-        'count': outliers.sum(),
-        'percentage': (outliers.sum() / len(series)) * 100,
+        'count': count,
+        'percentage': (count / len(series)) * 100,
         'lower_bound': lower_bound,
         'upper_bound': upper_bound
     }
@@ -107,11 +391,16 @@ def create_distribution_plot(
     figsize: Tuple[int, int] = (10, 6),
     color: str = 'steelblue',
     title: Optional[str] = None,
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    kde_sample_size: int = 10000
 ) -> plt.Figure:
     """
     Create a distribution plot with mean and median markers.
     
+    The histogram always uses every value. For columns longer than
+    ``kde_sample_size`` the KDE is fitted on a random subsample and drawn on
+    a secondary axis, since its cost grows faster than the histogram's.
+    
     Parameters
     ----------
     df : pd.DataFrame
@@ -126,6 +415,8 @@ def create_distribution_plot(
         Plot title. If None, uses column name.
     save_path : str, optional
         Path to save the figure.
+    kde_sample_size : int, optional
+        Maximum number of values used for the KDE. Default is 10000.
         
     Returns
     -------
@@ -134,7 +425,20 @@ def create_distribution_plot(
     """
     fig, ax = plt.subplots(figsize=figsize)
     
-    sns.histplot(data=df, x=column, kde=True, ax=ax, color=color, alpha=0.7)
+    if len(df) > kde_sample_size:
+        sns.histplot(data=df, x=column, kde=False, ax=ax, color=color, alpha=0.7)
+        
+        kde_sample = df[column].dropna().sample(
+            n=min(kde_sample_size, df[column].count()), random_state=0
+        )
+        kde_ax = ax.twinx()
+        sns.kdeplot(x=kde_sample, ax=kde_ax, color=color, bw_method='scott', cut=0)
+        kde_ax.set_ylim(bottom=0)
+        kde_ax.set_yticks([])
+        kde_ax.set_ylabel('')
+        kde_ax.grid(False)
+    else:
+        sns.histplot(data=df, x=column, kde=True, ax=ax, color=color, alpha=0.7)
     
     mean_val = df[column].mean()
     median_val = df[column].median()
@@ -171,17 +475,98 @@ def calculate_summary_stats(df: pd.DataFrame, numerical_cols: List[str]) -> pd.D
     pd.DataFrame
         Summary statistics dataframe.
     """
-    stats = df[numerical_cols].describe().T
+    # Columns as contiguous rows so each column is one streaming pass
+    values = np.ascontiguousarray(
+        df[numerical_cols].to_numpy(dtype=np.float64, na_value=np.nan).T
+    )
+    
+    if _HAS_NUMBA:
+        _, column_moments = _numba_kernels()
+        moments = column_moments(values)
+    else:
+        moments = _column_moments_numpy(values)
     
-    # Add additional statistics
-    stats['skew'] = df[numerical_cols].skew()
-    stats['kurtosis'] = df[numerical_cols].kurtosis()
-    stats['missing'] = df[numerical_cols].isnull().sum()
+    count, mean, m2, m3, m4, lo, hi, missing = moments.T
+    # Treat floating-point noise in the variance as zero, as pandas does
+    m2 = np.where(np.abs(m2) < 1e-14, 0.0, m2)
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        std = np.where(count > 1, np.sqrt(m2 / (count - 1)), np.nan)
+        
+        # Bias-corrected skewness and excess kurtosis (pandas' definitions)
+        skew = count * np.sqrt(count - 1) / (count - 2) * m3 / m2 ** 1.5
+        skew = np.where(m2 == 0, 0.0, skew)
+        skew = np.where(count < 3, np.nan, skew)
+        
+        kurt = (count * (count + 1) * (count - 1) * m4
+                / ((count - 2) * (count - 3) * m2 ** 2)
+                - 3 * (count - 1) ** 2 / ((count - 2) * (count - 3)))
+        kurt = np.where(m2 == 0, 0.0, kurt)
+        kurt = np.where(count < 4, np.nan, kurt)
+    
+    if values.shape[1] == 0:
+        q25 = q50 = q75 = np.full(len(values), np.nan)
+    else:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            q25, q50, q75 = np.nanpercentile(values, [25, 50, 75], axis=1)
+    
+    stats = pd.DataFrame({
+        'count': count,
+        'mean': mean,
+        'std': std,
+        'min': lo,
+        '25%': q25,
+        '50%': q50,
+        '75%': q75,
+        'max': hi,
+        'skew': skew,
+        'kurtosis': kurt,
+        'missing': missing.astype(np.int64)
+    }, index=list(numerical_cols))
     stats['missing_pct'] = (stats['missing'] / len(df)) * 100
     
     return stats
 
 
+def calculate_correlation_matrix(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """
+    Compute the Pearson correlation matrix for numerical columns.
+    
+    Standardizes the columns once and computes all pairs with a single
+    matrix product. Falls back to ``DataFrame.corr`` when the data contains
+    missing values, which need pairwise handling.
+    
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Input dataframe.
+    columns : list
+        List of numerical column names.
+        
+    Returns
+    -------
+    pd.DataFrame
+        Correlation matrix indexed by column name on both axes.
+    """
+    X = df[columns].to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+    
+    if np.isnan(X).any():
+        return df[columns].corr()
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        X -= X.mean(axis=0)
+        X /= X.std(axis=0, ddof=0)
+    C = (X.T @ X) / X.shape[0]
+    
+    # Remove rounding drift; constant columns stay NaN as with DataFrame.corr
+    np.clip(C, -1.0, 1.0, out=C)
+    diag = np.diag_indices_from(C)
+    C[diag] = np.where(np.isnan(C[diag]), np.nan, 1.0)
+    
+    return pd.DataFrame(C, index=list(columns), columns=list(columns))
+
+
 def create_correlation_heatmap(
     df: pd.DataFrame,
     columns: List[str],
@@ -207,8 +592,8 @@ def create_correlation_heatmap(
     plt.Figure
         Matplotlib figure object.
     """
-    correlation_matrix = df[columns].corr()
-    mask = np.triu(np.ones_like(correlation_matrix, dtype=bool))
+    correlation_matrix = calculate_correlation_matrix(df, columns)
+    mask = upper_triangle_mask(correlation_matrix.shape[0])
     
     fig, ax = plt.subplots(figsize=figsize)
     
@@ -234,6 +619,14 @@ def create_correlation_heatmap(
     return fig
 
 
+def _iso_weeks_in_year(year: np.ndarray) -> np.ndarray:
+    """Number of ISO-8601 weeks (52 or 53) in each given year."""
+    def dec31_weekday(y):
+        return (y + y // 4 - y // 100 + y // 400) % 7
+    
+    return 52 + ((dec31_weekday(year) == 4) | (dec31_weekday(year - 1) == 3))
+
+
 def extract_temporal_features(df: pd.DataFrame, timestamp_col: str) -> pd.DataFrame:
     """
     Extract temporal features from a timestamp column.
@@ -248,43 +641,111 @@ def extract_temporal_features(df: pd.DataFrame, timestamp_col: str) -> pd.DataFr
     Returns
     -------
     pd.DataFrame
-        Dataframe with added temporal features.
+        Dataframe with added temporal features (int16, or float64 with NaN
+        where the timestamp is missing).
     """
-    df = df.copy()
+    # New columns only, so a shallow copy leaves the caller's frame untouched
+    df = df.copy(deep=False)
+    
+    if not pd.api.types.is_datetime64_any_dtype(df[timestamp_col]):
+        df[timestamp_col] = pd.to_datetime(df[timestamp_col])
+    
+    timestamps = df[timestamp_col]
+    if timestamps.dt.tz is not None:
+        # Fields are taken from local wall time, as with the .dt accessors
+        timestamps = timestamps.dt.tz_localize(None)
+    ts = timestamps.to_numpy(dtype='datetime64[ns]')
+    nat = np.isnat(ts)
+    has_nat = nat.any()
+    
+    # Calendar fields from integer day/month/year ordinals since 1970
+    days = ts.astype('datetime64[D]').astype(np.int64)
+    year_start = ts.astype('datetime64[Y]')
+    year = year_start.astype(np.int64) + 1970
+    month = ts.astype('datetime64[M]').astype(np.int64) % 12 + 1
+    day_of_week = (days + 3) % 7  # 1970-01-01 was a Thursday; Monday=0
+    day_of_year = days - year_start.astype('datetime64[D]').astype(np.int64) + 1
+    
+    # ISO-8601 week number, rolling over into the adjacent ISO years
+    week = (day_of_year - (day_of_week + 1) + 10) // 7
+    week = np.select(
+        [week < 1, week > _iso_weeks_in_year(year)],
+        [_iso_weeks_in_year(year - 1), 1],
+        default=week
+    )
     
-    df[timestamp_col] = pd.to_datetime(df[timestamp_col])
-    df['year'] = df[timestamp_col].dt.year
-    df['month'] = df[timestamp_col].dt.month
-    df['day_of_week'] = df[timestamp_col].dt.dayofweek
-    df['quarter'] = df[timestamp_col].dt.quarter
-    df['day_of_year'] = df[timestamp_col].dt.dayofyear
-    df['week_of_year'] = df[timestamp_col].dt.isocalendar().week
+    features = {
+        'year': year,
+        'month': month,
+        'day_of_week': day_of_week,
+        'quarter': (month - 1) // 3 + 1,
+        'day_of_year': day_of_year,
+        'week_of_year': week
+    }
+    for name, values in features.items():
+        if has_nat:
+            df[name] = np.where(nat, np.nan, values)
+        else:
+            df[name] = values.astype(np.int16)
     
     return df
 
 
-def format_large_number(num: Union[int, float]) -> str:
+def format_large_number(
+    num: Union[int, float, np.ndarray, pd.Series]
+) -> Union[str, np.ndarray, pd.Series]:
     """
     Format large numbers for display (e.g., 1000000 -> '1.0M').
     
+    Array-like input is formatted in a single vectorized pass.
+    
     Parameters
     ----------
-    num : int or float
-        Number to format.
+    num : int, float, np.ndarray or pd.Series
+        Number(s) to format.
         
     Returns
     -------
-    str
-        Formatted string representation.
+    str, np.ndarray or pd.Series
+        Formatted string representation, matching the input's shape.
     """
-    if abs(num) >= 1e9:
-        return f'{num/1e9:.1f}B'
-    elif abs(num) >= 1e6:
-        return f'{num/1e6:.1f}M'
-    elif abs(num) >= 1e3:
-        return f'{num/1e3:.1f}K'
+    if np.ndim(num) == 0:
+        if abs(num) >= 1e9:
+            return f'{num/1e9:.1f}B'
+        elif abs(num) >= 1e6:
+            return f'{num/1e6:.1f}M'
+        elif abs(num) >= 1e3:
+            return f'{num/1e3:.1f}K'
+        else:
+            return str(num)
+    
+    if isinstance(num, pd.Series):
+        # Nullable integers go through object so they print as '5', not '5.0'
+        values = num.to_numpy(dtype=np.float64, na_value=np.nan)
+        if pd.api.types.is_extension_array_dtype(num.dtype):
+            raw = num.to_numpy(dtype=object)
+        else:
+            raw = num.to_numpy()
     else:
-        return str(num)
+        raw = np.asarray(num)
+        values = raw.astype(np.float64)
+    a = np.abs(values)
+    conds = [a >= 1e9, a >= 1e6, a >= 1e3]
+    
+    scaled = np.select(conds, [values / 1e9, values / 1e6, values / 1e3], default=values)
+    suffix = np.select(conds, ['B', 'M', 'K'], default='').astype('<U1')
+    
+    # Small numbers keep their str() form in the input dtype, so integers
+    # print as '5' and floats as '5.0', exactly as in the scalar path
+    formatted = np.where(
+        a >= 1e3,
+        np.char.add(np.char.mod('%.1f', scaled), suffix),
+        np.char.mod('%s', raw)
+    )
+    
+    if isinstance(num, pd.Series):
+        return pd.Series(formatted, index=num.index, name=num.name)
+    return formatted
 
 
 if __name__ == '__main__':
@@ -0,0 +1,199 @@
+"""
+Tests for the Udemy EDA utility module.
+"""
+
+import io
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from src.utils import (
+    calculate_correlation_matrix,
+    calculate_summary_stats,
+    detect_outliers_iqr,
+    extract_temporal_features,
+    format_large_number,
+    load_data
+)
+
+
+def _write_csv(path):
+    path.write_text(
+        'course_id,price,subject,published_timestamp\n'
+        '1,20.0,Web Development,2017-01-18T20:58:58Z\n'
+        '2,0.0,Business Finance,2016-03-01T01:02:03Z\n'
+    )
+    return path
+
+
+def _reference_temporal_features(timestamps):
+    ts = timestamps.dt
+    return pd.DataFrame({
+        'year': ts.year,
+        'month': ts.month,
+        'day_of_week': ts.dayofweek,
+        'quarter': ts.quarter,
+        'day_of_year': ts.dayofyear,
+        'week_of_year': ts.isocalendar().week
+    }).astype(np.float64)
+
+
+def _reference_summary_stats(df, cols):
+    stats = df[cols].describe().T
+    stats['skew'] = df[cols].skew()
+    stats['kurtosis'] = df[cols].kurtosis()
+    stats['missing'] = df[cols].isnull().sum()
+    stats['missing_pct'] = (stats['missing'] / len(df)) * 100
+    return stats
+
+
+def test_summary_stats_accepts_readonly_float_block():
+    # An all-float64 selection makes pandas return a read-only view
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({'a': rng.normal(size=200), 'b': rng.lognormal(size=200)})
+
+    stats = calculate_summary_stats(df, ['a', 'b'])
+
+    pd.testing.assert_frame_equal(stats, _reference_summary_stats(df, ['a', 'b']))
+
+
+def test_summary_stats_matches_pandas_with_missing_values():
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({
+        'price': np.r_[np.nan, rng.lognormal(size=99)],
+        'num_lectures': rng.integers(1, 100, size=100),
+        'constant': np.ones(100)
+    })
+    cols = list(df.columns)
+
+    pd.testing.assert_frame_equal(
+        calculate_summary_stats(df, cols), _reference_summary_stats(df, cols)
+    )
+
+
+def test_summary_stats_handles_empty_frame():
+    df = pd.DataFrame({'a': pd.Series(dtype=np.float64), 'b': pd.Series(dtype=np.int64)})
+
+    pd.testing.assert_frame_equal(
+        calculate_summary_stats(df, ['a', 'b']), _reference_summary_stats(df, ['a', 'b'])
+    )
+
+
+def test_detect_outliers_iqr_matches_series_quantile():
+    rng = np.random.default_rng(2)
+    for n in (1, 2, 3, 4, 7, 100, 1001):
+        series = pd.Series(rng.lognormal(size=n))
+        series[1::5] = np.nan
+        Q1, Q3 = series.quantile([0.25, 0.75])
+        lower, upper = Q1 - 1.5 * (Q3 - Q1), Q3 + 1.5 * (Q3 - Q1)
+        count = int(((series < lower) | (series > upper)).sum())
+
+        result = detect_outliers_iqr(series)
+
+        assert result['lower_bound'] == pytest.approx(lower)
+        assert result['upper_bound'] == pytest.approx(upper)
+        assert result['count'] == count
+
+
+def test_correlation_matrix_matches_dataframe_corr():
+    rng = np.random.default_rng(3)
+    a = rng.normal(size=500)
+    df = pd.DataFrame({
+        'a': a,
+        'b': 2 * a + rng.normal(size=500),
+        'c': rng.integers(0, 10, size=500),
+        'constant': np.full(500, 4.0)
+    })
+    cols = list(df.columns)
+
+    pd.testing.assert_frame_equal(calculate_correlation_matrix(df, cols), df[cols].corr())
+
+
+def test_extract_temporal_features_matches_dt_accessors():
+    timestamps = pd.Series(pd.to_datetime([
+        '2014-12-29 10:00', '2015-01-01 00:00', '2015-12-31 23:59',
+        '2016-01-03 12:00', '2020-12-31 08:00', '2021-01-03 08:00',
+        '2027-01-01 00:00', '2017-06-15 12:30'
+    ]))
+    cases = {
+        'naive': timestamps,
+        'tz-aware': timestamps.dt.tz_localize('UTC').dt.tz_convert('Asia/Kolkata'),
+        'with NaT': pd.concat([timestamps, pd.Series([pd.NaT])], ignore_index=True)
+    }
+    for name, ts in cases.items():
+        features = extract_temporal_features(pd.DataFrame({'ts': ts}), 'ts')
+        expected = _reference_temporal_features(ts)
+
+        pd.testing.assert_frame_equal(
+            features[expected.columns].astype(np.float64), expected, obj=name
+        )
+    assert features['year'].isna().iloc[-1]
+    assert (extract_temporal_features(pd.DataFrame({'ts': timestamps}), 'ts').dtypes[1:]
+            == np.int16).all()
+
+
+def test_load_data_writes_and_reuses_parquet_cache(tmp_path):
+    csv_path = _write_csv(tmp_path / 'courses.csv')
+
+    first = load_data(csv_path)
+    assert (tmp_path / 'courses.parquet').exists()
+
+    pd.testing.assert_frame_equal(load_data(csv_path), first)
+
+
+@pytest.mark.parametrize('error', [
+    OSError(28, 'No space left on device'),
+    pa.ArrowInvalid("Could not convert 'a' with type str: tried to convert to int64")
+])
+def test_load_data_falls_back_when_cache_write_fails(tmp_path, monkeypatch, error):
+    csv_path = _write_csv(tmp_path / 'courses.csv')
+
+    def fail_to_parquet(self, path, *args, **kwargs):
+        with open(path, 'wb') as f:
+            f.write(b'PAR1')  # partial write before the failure
+        raise error
+
+    monkeypatch.setattr(pd.DataFrame, 'to_parquet', fail_to_parquet)
+    df = load_data(csv_path)
+
+    assert len(df) == 2
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['courses.csv']
+
+
+def test_load_data_reads_file_objects_without_cache():
+    for use_cache in (True, False):
+        df = load_data(io.StringIO('a,b\n1,x\n'), use_cache=use_cache)
+
+        assert df['a'].tolist() == [1]
+
+
+def test_load_data_dtypes(tmp_path):
+    csv_path = _write_csv(tmp_path / 'courses.csv')
+
+    downcast = load_data(csv_path, use_cache=False)
+    assert downcast['course_id'].dtype == np.int32
+    assert downcast['price'].dtype == np.float32
+    assert isinstance(downcast['subject'].dtype, pd.CategoricalDtype)
+    assert isinstance(downcast['published_timestamp'].dtype, pd.DatetimeTZDtype)
+
+    full = load_data(csv_path, use_cache=False, dtype='full', categorical_cols=())
+    assert full['course_id'].dtype == np.int64
+    assert full['price'].dtype == np.float64
+    assert not isinstance(full['subject'].dtype, pd.CategoricalDtype)
+
+    with pytest.raises(ValueError):
+        load_data(csv_path, dtype='half')
+
+
+def test_format_large_number_array_matches_scalar():
+    for values in ([5.0, 999.0, 12.345, -2500.0, 1234567.0, 3e9], [5, 999, -2500, 1234567]):
+        arr = np.array(values)
+        expected = [format_large_number(v) for v in values]
+
+        assert list(format_large_number(arr)) == expected
+        assert list(format_large_number(pd.Series(arr))) == expected
+
+    nullable = pd.Series([1, None, 2500], dtype='Int64')
+    assert format_large_number(nullable).tolist() == ['1', '<NA>', '2.5K']